@@ -75,9 +75,10 @@ def mti_to_fea(
 def glyphview(
     ufo: Annotated[pathlib.Path, typer.Argument(help="Path to the UFO for the font", exists=True, readable=True)],
     port: Annotated[int, typer.Option(help="Serving port")] = 8000,
+    debug: Annotated[bool, typer.Option(help="Pretty-print the served HTML")] = False,
 ):
     from .glyphview import Viewer
 
-    viewer = Viewer(ufoLib2.Font.open(ufo))
+    viewer = Viewer(ufoLib2.Font.open(ufo), debug=debug)
     typer.echo(f"Now serving on port {port}.")
     viewer.serve(port=port)
@@ -1,21 +1,24 @@
 # SPDX-FileCopyrightText: 2025 Rose Davidson <rose@metaclassical.com>
 # SPDX-License-Identifier: MIT
+import functools
+import html
 import logging
 import unicodedata
+from collections.abc import Callable, Iterator
+from functools import cached_property
 from typing import Optional, cast
 
 import fontTools.unicodedata
 import ufoLib2.objects
 import webob.dec
 from fontTools.feaLib import ast
-from lxml.html import HtmlElement
-from lxml.html import builder as E
+from lxml.html import document_fromstring
 from lxml.html import tostring as html_tostring
 from webob.exc import HTTPBadRequest, HTTPNotFound
 from webob.request import Request
 from webob.response import Response
 
-from .otufo import Font, LookupFlagValue
+from .otufo import SCRIPT_ORDER, Font, LookupFlagValue
 from .svg import GlyphSvg, NamedAnchor
 
 logger = logging.getLogger(__name__)
@@ -27,145 +30,140 @@ svg.rendered {
 }
 """
 
-
-def codepoint_info(codepoint: int) -> HtmlElement:
-    try:
-        charname = unicodedata.name(chr(codepoint))
-    except ValueError:
+# The leaf cards are built from string templates rather than lxml elements; on the all-glyphs page there are thousands of them.
+# Every value interpolated into these templates must already be HTML-escaped.
+CODEPOINT_CARD_TMPL = (
+    '<div class="card"><div class="card-body"><h5 class="card-title">'
+    '<a class="codepoint" href="https://codepoints.net/{fmt}">{fmt}</a></h5>'
+    '<p class="card-text character-name">{name}</p></div></div>'
+)
+LIGATURE_CARD_TMPL = '<div class="card-group">{cards}</div>'
+GLYPH_INFO_TMPL = '<div class="hstack gap-3 glyph-info"><span class="glyphname">{name}</span>{codepoints}</div>'
+GLYPH_CARD_TMPL = '<div class="col"><div class="card"><div class="card-body">{body}</div>{svg}</div></div>'
+
+FLAG_LABELS = (
+    (LookupFlagValue.RIGHT_TO_LEFT, "Right-to-Left"),
+    (LookupFlagValue.IGNORE_BASE_GLYPHS, "Ignore Base Glyphs"),
+    (LookupFlagValue.IGNORE_LIGATURES, "Ignore Ligatures"),
+    (LookupFlagValue.IGNORE_MARKS, "Ignore Marks"),
+)
+
+NAVBAR_TMPL = (
+    '<nav class="navbar navbar-expand sticky-top bg-body-tertiary"><div class="container-fluid">'
+    '<a class="navbar-brand" href="/">{font_name}</a>'
+    '<div class="collapse navbar-collapse"><ul class="navbar-nav me-auto">{items}</ul></div>'
+    "</div></nav>"
+)
+DROPDOWN_TMPL = (
+    '<li class="nav-item dropdown">'
+    '<a class="nav-link dropdown-toggle" href="#" role="button" data-bs-toggle="dropdown" aria-expanded="false">{label}</a>'
+    '<ul class="dropdown-menu">{items}</ul></li>'
+)
+
+# The page shell is split around the content, so that streamed pages can send the head before the content is ready.
+PAGE_HEAD_TMPL = (
+    "<!doctype html>\n"
+    '<html lang="en"><head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">'
+    "<title>{title} OpenType Features</title>"
+    '<link rel="stylesheet" crossorigin="anonymous" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css">'
+    "<style>{styles}</style></head>"
+    "<body>{navbar}"
+)
+PAGE_FOOT = (
+    '<script crossorigin="anonymous" src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"></script>'
+    "</body></html>"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def codepoint_info(codepoint: int) -> str:
+    charname = unicodedata.name(chr(codepoint), None)
+    if charname is None:
         logger.warning("Codepoint U+%04X has no name in the unicode database.", codepoint)
         charname = "[No character name]"
     formatted = "U+{:04X}".format(codepoint)
-    return E.DIV(
-        E.CLASS("card"),
-        E.DIV(
-            E.CLASS("card-body"),
-            E.H5(
-                E.CLASS("card-title"),
-                E.A(
-                    formatted,
-                    {
-                        "class": "codepoint",
-                        "href": f"https://codepoints.net/{formatted}",
-                    },
-                ),
-            ),
-            E.P(E.CLASS("card-text character-name"), charname),
-        ),
-    )
+    return CODEPOINT_CARD_TMPL.format(fmt=formatted, name=html.escape(charname))
 
 
-def ligature_info(codepoints: tuple[int, ...]) -> HtmlElement:
-    return E.DIV(E.CLASS("card-group"), *[codepoint_info(codepoint) for codepoint in codepoints])
+@functools.lru_cache(maxsize=4096)
+def ligature_info(codepoints: tuple[int, ...]) -> str:
+    return LIGATURE_CARD_TMPL.format(cards="".join(codepoint_info(codepoint) for codepoint in codepoints))
 
 
-def glyph_unicode_info(glyph_svg: GlyphSvg) -> HtmlElement:
+@functools.lru_cache(maxsize=None)
+def _glyph_unicode_info_html(escaped_name: str, unicodes: tuple[int | tuple[int, ...], ...]) -> str:
     codepoints = []
-    for alternative in glyph_svg.unicodes:
+    for alternative in unicodes:
         if isinstance(alternative, int):
             codepoints.append(codepoint_info(alternative))
         else:
             # tuple of ints: a ligature
             codepoints.append(ligature_info(alternative))
 
-    container = E.DIV(E.CLASS("hstack gap-3 glyph-info"), E.SPAN(E.CLASS("glyphname"), glyph_svg.glyph.name))
-    if codepoints:
-        container.append(E.DIV(E.CLASS("vr")))
-        if len(codepoints) == 1:
-            container.append(codepoints[0])
-        else:
-            container.append(E.DIV(E.CLASS("vstack gap-2"), *codepoints))
-    return container
+    if not codepoints:
+        codepoints_html = ""
+    elif len(codepoints) == 1:
+        codepoints_html = '<div class="vr"></div>' + codepoints[0]
+    else:
+        codepoints_html = '<div class="vr"></div><div class="vstack gap-2">' + "".join(codepoints) + "</div>"
+    return GLYPH_INFO_TMPL.format(name=escaped_name, codepoints=codepoints_html)
 
 
-def navbar(font: Font) -> HtmlElement:
-    nav_elements = []
-    scripts = sorted(font.supported_scripts, key=fontTools.unicodedata.Scripts.VALUES.index)
-    all_glyphs_scripts = [
-        E.LI(E.A(E.CLASS("dropdown-item"), fontTools.unicodedata.script_name(script), href=f"/glyphs?script={script}"))
-        for script in scripts
-    ]
-    nav_elements.append(
-        E.LI(
-            E.CLASS("nav-item dropdown"),
-            E.A(
-                E.CLASS("nav-link dropdown-toggle"),
-                "Glyphs",
-                {"href": "#", "role": "button", "data-bs-toggle": "dropdown", "aria-expanded": "false"},
-            ),
-            E.UL(
-                E.CLASS("dropdown-menu"),
-                E.LI(E.A(E.CLASS("dropdown-item"), "All Glyphs", href="/glyphs")),
-                E.LI(E.HR(E.CLASS("dropdown-divider"))),
-                *all_glyphs_scripts,
-            ),
-        )
+def glyph_unicode_info(glyph_svg: GlyphSvg) -> str:
+    return _glyph_unicode_info_html(glyph_svg.escaped_name, glyph_svg.unicodes)
+
+
+def _dropdown_html(label: str, items_html: str) -> str:
+    return DROPDOWN_TMPL.format(label=html.escape(label), items=items_html)
+
+
+def _dropdown_item_html(label: str, href: str) -> str:
+    return f'<li><a class="dropdown-item" href="{html.escape(href)}">{html.escape(label)}</a></li>'
+
+
+def navbar(font: Font) -> str:
+    scripts = sorted(font.supported_scripts, key=SCRIPT_ORDER.__getitem__)
+    all_glyphs_scripts = "".join(
+        _dropdown_item_html(fontTools.unicodedata.script_name(script), f"/glyphs?script={script}") for script in scripts
     )
+    nav_elements = [
+        _dropdown_html(
+            "Glyphs",
+            _dropdown_item_html("All Glyphs", "/glyphs") + '<li><hr class="dropdown-divider"></li>' + all_glyphs_scripts,
+        )
+    ]
     for feature in font.viewable_features:
-        lookup_lis = [
-            E.LI(
-                E.A(
-                    E.CLASS("dropdown-item"),
-                    " — ".join([lookup.name, fontTools.unicodedata.script_name(lookup.script)])
-                    if lookup.script is not None
-                    else lookup.name,
-                    href=f"/lookup?feature={feature.tag}&name={lookup.name}",
-                )
+        lookup_lis = "".join(
+            _dropdown_item_html(
+                " — ".join([lookup.name, fontTools.unicodedata.script_name(lookup.script)]) if lookup.script is not None else lookup.name,
+                f"/lookup?feature={feature.tag}&name={lookup.name}",
             )
             for lookup in feature.lookups
-        ]
-        nav_elements.append(
-            E.LI(
-                E.CLASS("nav-item dropdown"),
-                E.A(
-                    E.CLASS("nav-link dropdown-toggle"),
-                    f"Feature: {feature.tag}",
-                    {"href": "#", "role": "button", "data-bs-toggle": "dropdown", "aria-expanded": "false"},
-                ),
-                E.UL(
-                    E.CLASS("dropdown-menu"),
-                    *lookup_lis,
-                ),
-            )
         )
+        nav_elements.append(_dropdown_html(f"Feature: {feature.tag}", lookup_lis))
 
-    return E.E.nav(
-        E.CLASS("navbar navbar-expand sticky-top bg-body-tertiary"),
-        E.DIV(
-            E.CLASS("container-fluid"),
-            E.A(E.CLASS("navbar-brand"), font.font_name, href="/"),
-            E.DIV(E.CLASS("collapse navbar-collapse"), E.UL(E.CLASS("navbar-nav me-auto"), *nav_elements)),
-        ),
-    )
+    return NAVBAR_TMPL.format(font_name=html.escape(font.font_name), items="".join(nav_elements))
 
 
-def page_structure(font: Font, content: HtmlElement) -> str:
-    doc = E.HTML(
-        E.HEAD(
-            E.META(charset="utf-8"),
-            E.META(name="viewport", content="width=device-width, initial-scale=1"),
-            E.TITLE(f"{font.font_name} OpenType Features"),
-            E.LINK(
-                rel="stylesheet",
-                crossorigin="anonymous",
-                href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css",
-            ),
-            E.STYLE(PAGE_STYLES),
-        ),
-        E.BODY(
-            navbar(font),
-            content,
-            E.SCRIPT(
-                crossorigin="anonymous",
-                src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js",
-            ),
-        ),
-        lang="en",
+def page_head(font: Font, nav: Optional[str] = None) -> str:
+    """Everything in the page before the content. Pass a pre-rendered navbar to avoid rebuilding it for every page."""
+    return PAGE_HEAD_TMPL.format(
+        title=html.escape(font.font_name),
+        styles=PAGE_STYLES,
+        navbar=navbar(font) if nav is None else nav,
     )
-    return html_tostring(doc, doctype="<!doctype html>", pretty_print=True)
 
 
-def render_mark_to_base(font: Font, rule: ast.MarkBasePosStatement):
-    row = E.DIV(E.CLASS("row"))
+def page_structure(font: Font, content: str, nav: Optional[str] = None) -> str:
+    return page_head(font, nav=nav) + content + PAGE_FOOT
+
+
+def pretty_page(page: str) -> str:
+    """Re-indent a rendered page so its source is readable. This re-parses the whole page, so it is only done in debug mode."""
+    return html_tostring(document_fromstring(page), doctype="<!doctype html>", pretty_print=True, encoding="unicode")
+
+
+def render_mark_to_base(font: Font, rule: ast.MarkBasePosStatement) -> str:
     anchors = []
     for anchor, mark_class in rule.marks:
         anchors.append(NamedAnchor(x=anchor.x, y=anchor.y, name=mark_class.name))
@@ -176,158 +174,155 @@ def render_mark_to_base(font: Font, rule: ast.MarkBasePosStatement):
         glyphs.extend(rule.base.glyphs)
     else:
         raise TypeError(type(rule.base))
+    cards = []
     for glyphname in glyphs:
         glyph_svg = font[glyphname]
-        svg_el = glyph_svg.draw_origin_and_anchors(*anchors)
-        svg_el.set("class", "card-img-bottom rendered")
-        svg_card = E.DIV(
-            E.CLASS("card"),
-            E.DIV(E.CLASS("card-body"), glyph_unicode_info(glyph_svg)),
-            svg_el,
-        )
-        row.append(E.DIV(E.CLASS("col"), svg_card))
+        svg = glyph_svg.origin_and_anchors_svg(*anchors, css_class="card-img-bottom rendered")
+        cards.append(GLYPH_CARD_TMPL.format(body=glyph_unicode_info(glyph_svg), svg=svg))
 
-    return row
+    return '<div class="row">' + "".join(cards) + "</div>"
 
 
-def render_mark_class(font: Font, mark_class: ast.MarkClass):
-    container = E.DIV(E.P(mark_class.name))
-    row = E.DIV(E.CLASS("row"))
+def render_mark_class(font: Font, mark_class: ast.MarkClass) -> str:
+    cards = []
     for definition in mark_class.definitions:
         definition = cast("ast.MarkClassDefinition", definition)
         anchor = NamedAnchor(x=definition.anchor.x, y=definition.anchor.y, name=mark_class.name)
         assert isinstance(definition.glyphs, ast.GlyphClass)
         for glyphname in definition.glyphs.glyphs:
             glyph_svg = font[glyphname]
-            svg_el = glyph_svg.draw_origin_and_anchors(anchor)
-            svg_el.set("class", "card-img-bottom rendered")
-            svg_card = E.DIV(
-                E.CLASS("card"),
-                E.DIV(E.CLASS("card-body"), glyph_unicode_info(glyph_svg), E.DIV(E.CLASS("card-text"), f"({anchor.x}, {anchor.y})")),
-                svg_el,
-            )
-            row.append(E.DIV(E.CLASS("col"), svg_card))
-    container.append(row)
-    return container
+            svg = glyph_svg.origin_and_anchors_svg(anchor, css_class="card-img-bottom rendered")
+            body = f'{glyph_unicode_info(glyph_svg)}<div class="card-text">({anchor.x}, {anchor.y})</div>'
+            cards.append(GLYPH_CARD_TMPL.format(body=body, svg=svg))
+    return f'<div><p>{html.escape(mark_class.name)}</p><div class="row">{"".join(cards)}</div></div>'
 
 
-def render_unsupported_rule(rule: ast.Statement):
-    return E.P(f"Rules of type {type(rule)} are not yet supported.", E.BR(), E.CODE(rule.asFea()))
+def render_unsupported_rule(rule: ast.Statement) -> str:
+    return f"<p>Rules of type {html.escape(str(type(rule)))} are not yet supported.<br><code>{html.escape(rule.asFea())}</code></p>"
 
 
-def render_lookup(font: Font, feature: str, lookup: str):
+def render_lookup(font: Font, feature: str, lookup: str, nav: Optional[str] = None):
     logger.debug("Looking for lookup %s in feature %s", lookup, feature)
-    lookup_obj = None
-    for feature_obj in font.viewable_features:
-        if feature_obj.tag != feature:
-            continue
-        for candidate in feature_obj.lookups:
-            if candidate.name == lookup:
-                lookup_obj = candidate
-                break
+    lookup_obj = font.lookup_index.get((feature, lookup))
     if lookup_obj is None:
         raise KeyError(f"Cannot find feature {feature} with lookup {lookup}")
-    container = E.DIV(E.CLASS("container"))
-    container.append(E.H1(lookup_obj.name))
+    fragments = ['<div class="container">', f"<h1>{html.escape(lookup_obj.name)}</h1>"]
     if lookup_obj.flags:
-        lookup_flags = []
-        if lookup_obj.flags.flag & LookupFlagValue.RIGHT_TO_LEFT:
-            lookup_flags.append(E.LI("Right-to-Left"))
-        if lookup_obj.flags.flag & LookupFlagValue.IGNORE_BASE_GLYPHS:
-            lookup_flags.append(E.LI("Ignore Base Glyphs"))
-        if lookup_obj.flags.flag & LookupFlagValue.IGNORE_LIGATURES:
-            lookup_flags.append(E.LI("Ignore Ligatures"))
-        if lookup_obj.flags.flag & LookupFlagValue.IGNORE_MARKS:
-            lookup_flags.append(E.LI("Ignore Marks"))
+        lookup_flags = [label for bit, label in FLAG_LABELS if lookup_obj.flags.flag & bit]
         if lookup_obj.flags.mark_attachment:
-            lookup_flags.append(E.LI(f"Mark Attachment: {lookup_obj.flags.mark_attachment.asFea()}"))
+            lookup_flags.append(f"Mark Attachment: {lookup_obj.flags.mark_attachment.asFea()}")
         if lookup_obj.flags.mark_filtering_set:
-            lookup_flags.append(E.LI(f"Mark Filtering Set: {lookup_obj.flags.mark_filtering_set.asFea()}"))
+            lookup_flags.append(f"Mark Filtering Set: {lookup_obj.flags.mark_filtering_set.asFea()}")
         if lookup_flags:
-            container.append(E.UL(*lookup_flags))
+            fragments.append("<ul>" + "".join(f"<li>{html.escape(flag)}</li>" for flag in lookup_flags) + "</ul>")
     mark_classes = []
+    seen_mark_classes = set()  # MarkClass compares by identity, so it can be tracked in a set
     for rule in lookup_obj.rules:
         if isinstance(rule, ast.MarkBasePosStatement):
             for _anchor, mark_class in rule.marks:
-                if mark_class not in mark_classes:
+                if mark_class not in seen_mark_classes:
+                    seen_mark_classes.add(mark_class)
                     mark_classes.append(mark_class)
     for mark_class in mark_classes:
-        container.append(render_mark_class(font, mark_class))
+        fragments.append(render_mark_class(font, mark_class))
 
     for rule in lookup_obj.rules:
         if isinstance(rule, ast.MarkBasePosStatement):
-            container.append(render_mark_to_base(font, rule))
+            fragments.append(render_mark_to_base(font, rule))
         else:
-            container.append(render_unsupported_rule(rule))
-    return page_structure(font, container)
-
+            fragments.append(render_unsupported_rule(rule))
+    fragments.append("</div>")
+    return page_structure(font, "".join(fragments), nav=nav)
 
-def render_all_glyphs(font: Font, script: Optional[str] = None):
-    container = E.DIV(E.CLASS("container"))
 
+def render_all_glyphs(font: Font, script: Optional[str] = None, nav: Optional[str] = None) -> Iterator[str]:
+    """Render the all-glyphs page as a sequence of chunks, so it can be streamed while later glyphs are still being drawn."""
+    # Resolve the script eagerly, so an unknown script fails before any of the response has been sent.
     script_glyphs = None if script is None else font.script_glyphs(script)
+    head = page_head(font, nav=nav)
+
+    def chunks():
+        yield head
+        yield '<div class="container">'
+        for glyphname in font.typeable_glyphs_ordered:
+            if script_glyphs is not None and glyphname not in script_glyphs:
+                continue
+            glyph_svg = font[glyphname]
+            yield f"<div>{glyph_unicode_info(glyph_svg)}{glyph_svg.origin_svg}</div>"
+        yield "</div>"
+        yield PAGE_FOOT
 
-    for glyphname in font.all_glyphs:
-        if glyphname not in font.typeable_glyphs:
-            continue
-        if script_glyphs is not None and glyphname not in script_glyphs:
-            continue
-        glyph_svg = font[glyphname]
-        svg_el = glyph_svg.draw_origin()
-        svg_el.set("class", "rendered")
-        container.append(E.DIV(glyph_unicode_info(glyph_svg), svg_el))
-    return page_structure(font, container)
+    return chunks()
 
 
-def render_font_info(font: Font):
-    container = E.DIV(E.CLASS("container"))
-    scripts = sorted(font.supported_scripts, key=fontTools.unicodedata.Scripts.VALUES.index)
+def render_font_info(font: Font, nav: Optional[str] = None):
+    scripts = sorted(font.supported_scripts, key=SCRIPT_ORDER.__getitem__)
     script_names = ", ".join(fontTools.unicodedata.script_name(script) for script in scripts)
-    container.append(
-        E.DIV(
-            E.CLASS("card"),
-            E.DIV(
-                E.CLASS("card-body"),
-                E.H5(E.CLASS("card-title"), font.font_name),
-                E.P(
-                    E.CLASS("card-text"),
-                    E.UL(
-                        E.CLASS("list-group list-group-flush"),
-                        E.LI(E.CLASS("list-group-item"), f"Glyphs: {len(font.all_glyphs)}"),
-                        E.LI(E.CLASS("list-group-item"), f"Supported Scripts: {script_names}"),
-                    ),
-                ),
-            ),
-        )
+    return page_structure(
+        font,
+        '<div class="container"><div class="card"><div class="card-body">'
+        f'<h5 class="card-title">{html.escape(font.font_name)}</h5>'
+        '<p class="card-text"><ul class="list-group list-group-flush">'
+        f'<li class="list-group-item">Glyphs: {len(font.all_glyphs)}</li>'
+        f'<li class="list-group-item">Supported Scripts: {html.escape(script_names)}</li>'
+        "</ul></p></div></div></div>",
+        nav=nav,
     )
-    return page_structure(font, container)
 
 
 class Viewer:
-    def __init__(self, ufo: ufoLib2.objects.Font):
+    def __init__(self, ufo: ufoLib2.objects.Font, debug: bool = False):
         self.font = Font(ufo)
+        self.debug = debug
+        self._routes: dict[str, Callable[[Request], Response]] = {
+            "/": self._serve_info,
+            "/glyphs": self._serve_glyphs,
+            "/lookup": self._serve_lookup,
+        }
+        # Parse and compile the features and classify the glyphs at startup, instead of during the first request.
+        _ = self.font.font_name, self.font.supported_scripts, self.font.typeable_glyphs_ordered, self.font.lookup_index
+
+    @cached_property
+    def navbar_html(self) -> str:
+        return navbar(self.font)
+
+    @cached_property
+    def font_info_page(self) -> str:
+        return render_font_info(self.font, nav=self.navbar_html)
 
     @webob.dec.wsgify
     def __call__(self, req: Request):
-        match req.path_info:
-            case "/":
-                return Response(render_font_info(self.font))
-            case "/glyphs":
-                script = None
-                if "script" in req.GET:
-                    try:
-                        script = req.GET.getone("script")
-                    except KeyError:
-                        return HTTPBadRequest()
-                return Response(render_all_glyphs(self.font, script=script))
-            case "/lookup":
-                feature = req.GET.getone("feature")
-                lookup = req.GET.getone("name")
-                try:
-                    return Response(render_lookup(self.font, feature, lookup))
-                except KeyError:
-                    return HTTPBadRequest()
-        return HTTPNotFound(comment=req.path_info)
+        handler = self._routes.get(req.path_info)
+        if handler is None:
+            return HTTPNotFound(comment=req.path_info)
+        return handler(req)
+
+    def _serve_info(self, _req: Request):
+        return self.page_response(self.font_info_page)
+
+    def _serve_glyphs(self, req: Request):
+        script = None
+        if "script" in req.GET:
+            try:
+                script = req.GET.getone("script")
+            except KeyError:
+                return HTTPBadRequest()
+        return self.page_response(render_all_glyphs(self.font, script=script, nav=self.navbar_html))
+
+    def _serve_lookup(self, req: Request):
+        feature = req.GET.getone("feature")
+        lookup = req.GET.getone("name")
+        try:
+            return self.page_response(render_lookup(self.font, feature, lookup, nav=self.navbar_html))
+        except KeyError:
+            return HTTPBadRequest()
+
+    def page_response(self, page: str | Iterator[str]) -> Response:
+        if isinstance(page, str):
+            return Response(pretty_page(page) if self.debug else page)
+        if self.debug:
+            return Response(pretty_page("".join(page)))
+        return Response(app_iter=(chunk.encode("utf-8") for chunk in page))
 
     def serve(self, port: int):
         import waitress
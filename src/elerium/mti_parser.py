@@ -93,7 +93,7 @@ class FeatureTableEntry:
         return block
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class Lookup:
     lookup_id: str
     flags: LookupFlag = LookupFlag.NONE
@@ -261,7 +261,7 @@ def to_ast(*files: FeatureFile):
     return root
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AnchorPoint:
     x: int
     y: int
@@ -1155,10 +1155,18 @@ class Parser:
         self.gdef = pathlib.Path(gdef_path).read_text()
         return self
 
+    def add_GDEF_from_text(self, gdef_txt: str):
+        self.gdef = gdef_txt
+        return self
+
     def add_GSUB(self, gsub_path: PathLike):
         self.gsub = pathlib.Path(gsub_path).read_text()
         return self
 
+    def add_GSUB_from_text(self, gsub_txt: str):
+        self.gsub = gsub_txt
+        return self
+
     def add_GPOS(self, gpos_path: PathLike):
         self.gpos = pathlib.Path(gpos_path).read_text()
         return self
@@ -11,7 +11,7 @@ import ufoLib2.objects
 from fontTools.feaLib import ast
 from fontTools.ttLib.tables.G_D_E_F_ import table_G_D_E_F_
 from fontTools.ttLib.tables.G_S_U_B_ import table_G_S_U_B_
-from fontTools.unicodedata import ot_tag_to_script
+from fontTools.unicodedata import Scripts, ot_tag_to_script
 from ufo2ft.fontInfoData import getAttrWithFallback
 from ufo2ft.util import (
     classifyGlyphs,
@@ -29,6 +29,8 @@ from .util import parse_ufo_features
 logger = logging.getLogger(__name__)
 
 VIEWABLE_FEATURES = frozenset(("mark",))
+# Sort key for Unicode script codes, ordered by first appearance in fontTools.unicodedata.Scripts.VALUES (which has repeats).
+SCRIPT_ORDER = {script: i for i, script in enumerate(dict.fromkeys(Scripts.VALUES))}
 
 
 class GlyphClass(enum.IntEnum):
@@ -62,8 +64,9 @@ class Font:
         return parse_ufo_features(self.ufo)
 
     @cached_property
-    def _script_glyphs(self) -> dict[str, set[str]]:
-        return classifyGlyphs(unicodeScriptExtensions, self.cmap, self._gsub)
+    def _script_glyphs(self) -> dict[str, frozenset[str]]:
+        classified = classifyGlyphs(unicodeScriptExtensions, self.cmap, self._gsub)
+        return {script: frozenset(glyphs) for script, glyphs in classified.items()}
 
     @cached_property
     def supported_scripts(self) -> frozenset[str]:
@@ -86,15 +89,22 @@ class Font:
 
     def script_glyphs(self, script: str) -> frozenset[str]:
         """Returns a set of glyphs which belong to this script."""
-        return frozenset(self._script_glyphs[script])
+        return self._script_glyphs[script]
 
     @cached_property
     def typeable_glyphs(self) -> frozenset[str]:
         """Returns a set of all glyphs which can be typed, either because they have a Unicode codepoint mapping, or there is a substitution rule which produces them from typeable glyphs."""
         glyphs = set(self.cmap.values())
-        closeGlyphsOverGSUB(self._gsub, glyphs)
+        if self._gsub is not None:
+            closeGlyphsOverGSUB(self._gsub, glyphs)
         return frozenset(glyphs)
 
+    @cached_property
+    def typeable_glyphs_ordered(self) -> tuple[str, ...]:
+        """The typeable glyphs, in glyph order."""
+        typeable = self.typeable_glyphs
+        return tuple(glyphname for glyphname in self.all_glyphs if glyphname in typeable)
+
     @cached_property
     def _gsub(self) -> Optional[table_G_S_U_B_]:
         if self.features is None:
@@ -122,6 +132,8 @@ class Font:
 
     @cached_property
     def viewable_features(self) -> tuple["Feature", ...]:
+        if self.features is None:
+            return ()
         viewable = {}
         for stmt in self.features.statements:
             if not isinstance(stmt, ast.FeatureBlock):
@@ -131,6 +143,15 @@ class Font:
             viewable.setdefault(stmt.name, []).append(stmt)
         return tuple(Feature.from_feature_blocks(viewable[tag]) for tag in sorted(viewable))
 
+    @cached_property
+    def lookup_index(self) -> dict[tuple[str, str], "Lookup"]:
+        """Maps (feature tag, lookup name) to the viewable lookup. A lookup referenced under several scripts maps to the first reference."""
+        index = {}
+        for feature in self.viewable_features:
+            for lookup in feature.lookups:
+                index.setdefault((feature.tag, lookup.name), lookup)
+        return index
+
 
 @dataclasses.dataclass(kw_only=True)
 class Feature:
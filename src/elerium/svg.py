@@ -1,22 +1,45 @@
 # SPDX-FileCopyrightText: 2025 Rose Davidson <rose@metaclassical.com>
 # SPDX-License-Identifier: MIT
 import dataclasses
+import html
 import logging
+from functools import cached_property
+from xml.sax.saxutils import escape as xml_escape
+from xml.sax.saxutils import quoteattr
 
 from fontTools.misc.arrayTools import rectCenter
 from fontTools.pens.svgPathPen import SVGPathPen
-from lxml import etree
 from ufoLib2.objects import Font, Glyph, Point
-from ufoLib2.objects.misc import BoundingBox, unionBounds
+from ufoLib2.objects.misc import BoundingBox
 
 from .util import find_glyph_codepoints
 
 logger = logging.getLogger(__name__)
 
+# The area around the origin which is always included in the canvas.
+ORIGIN_BOUNDS = BoundingBox(xMin=-100, xMax=100, yMin=-100, yMax=100)
 ORIGIN_STYLE = "stroke: blue; stroke-width: 5px"
 ANCHOR_STYLE = "fill: red;"
 ANCHOR_TEXT_STYLE = "font-size: 40pt; fill: red;"
 
+# Values interpolated into these templates must already be XML-escaped; attribute values passed through quoteattr supply their own quotes.
+SVG_TMPL = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+    'preserveAspectRatio="xMidYMid" class={css_class}>'
+    '<g class="glyph" data-glyph-name={glyph_name} data-glyph-height="{glyph_height}" data-glyph-width="{glyph_width}" '
+    'data-glyph-center-x="{glyph_center_x}" data-glyph-center-y="{glyph_center_y}" transform="{transform}">'
+    '<path d="{d}"/></g>'
+    '<g class="origin" data-origin-x="{origin_x}" data-origin-y="{origin_y}" style="{origin_style}">'
+    '<line x1="{origin_x}" y1="{origin_top}" x2="{origin_x}" y2="{origin_bottom}"/>'
+    '<line x1="{origin_left}" y1="{origin_y}" x2="{origin_right}" y2="{origin_y}"/>'
+    "</g>{anchors}</svg>"
+)
+ANCHOR_TMPL = (
+    '<g class="anchor" data-anchor-x="{x}" data-anchor-y="{y}" transform="{transform}">'
+    '<circle cx="{x}" cy="{y}" r="10" style="{style}"/></g>'
+    '<text x="{label_x}" y="{label_y}" class="anchor-label" style="{label_style}">{name}</text>'
+)
+
 
 @dataclasses.dataclass(kw_only=True, frozen=True)
 class NamedAnchor:
@@ -24,10 +47,6 @@ class NamedAnchor:
     y: int
     name: str
 
-    @property
-    def anchor_bounds(self):
-        return BoundingBox(xMin=self.x - 100, xMax=self.x + 100, yMin=self.y - 100, yMax=self.y + 100)
-
 
 @dataclasses.dataclass(kw_only=True)
 class GlyphSvg:
@@ -35,6 +54,9 @@ class GlyphSvg:
     unicodes: tuple[int | tuple[int, ...], ...]
     bounds: BoundingBox
     d: str
+    _svg_cache: dict[tuple[tuple[NamedAnchor, ...], str], str] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def draw_glif(cls, ufo: Font, glyph_name: str):
@@ -56,115 +78,67 @@ class GlyphSvg:
 
         return cls(glyph=glyph, bounds=bounds, d=commands, unicodes=unicodes)
 
-    def draw_origin(self):
-        return self.draw_origin_and_anchors()
-
-    def draw_origin_and_anchors(self, *anchors: NamedAnchor):
-        origin_bounds = BoundingBox(xMin=-100, xMax=100, yMin=-100, yMax=100)
-        canvas_bounds = unionBounds(origin_bounds, self.bounds)
-
-        if anchors:
-            for anchor in anchors:
-                canvas_bounds = unionBounds(anchor.anchor_bounds, canvas_bounds)
-        canvas_xmin = canvas_bounds.xMin - 100
-        canvas_xmax = canvas_bounds.xMax + 100
-        canvas_ymin = canvas_bounds.yMin - 100
-        canvas_ymax = canvas_bounds.yMax + 100
+    @cached_property
+    def escaped_name(self) -> str:
+        return html.escape(self.glyph.name)
+
+    @cached_property
+    def origin_svg(self) -> str:
+        """Serialized SVG of the glyph and its origin, with the ``rendered`` class already applied."""
+        return self.origin_and_anchors_svg(css_class="rendered")
+
+    def origin_and_anchors_svg(self, *anchors: NamedAnchor, css_class: str) -> str:
+        """Serialized SVG of the glyph, its origin, and the given anchors, with the given class on the root element, cached per anchor tuple."""
+        key = (anchors, css_class)
+        if key not in self._svg_cache:
+            self._svg_cache[key] = self._svg_markup(anchors, css_class=css_class)
+        return self._svg_cache[key]
+
+    def _svg_markup(self, anchors: tuple[NamedAnchor, ...], css_class: str) -> str:
+        # The canvas covers the glyph, the origin, and every anchor, each padded by 100 units, plus a further 100-unit margin.
+        canvas_xmin = min([self.bounds.xMin, ORIGIN_BOUNDS.xMin] + [anchor.x - 100 for anchor in anchors]) - 100
+        canvas_xmax = max([self.bounds.xMax, ORIGIN_BOUNDS.xMax] + [anchor.x + 100 for anchor in anchors]) + 100
+        canvas_ymin = min([self.bounds.yMin, ORIGIN_BOUNDS.yMin] + [anchor.y - 100 for anchor in anchors]) - 100
+        canvas_ymax = max([self.bounds.yMax, ORIGIN_BOUNDS.yMax] + [anchor.y + 100 for anchor in anchors]) + 100
 
         canvas_height = canvas_ymax - canvas_ymin
         canvas_width = canvas_xmax - canvas_xmin
 
         origin = Point(x=abs(canvas_xmin), y=abs(canvas_ymax))
-        svg = etree.Element(
-            "svg",
-            width=str(canvas_width),
-            height=str(canvas_height),
-            viewBox=f"0 0 {canvas_width} {canvas_height}",
-            preserveAspectRatio="xMidYMid",
-            xmlns="http://www.w3.org/2000/svg",
-        )
-
         glyph_center = Point(*rectCenter(self.bounds))
-        glyph_path = etree.Element("path", {"d": self.d})
-        transform_group = etree.Element(
-            "g",
-            {
-                "class": "glyph",
-                "data-glyph-name": self.glyph.name,
-                "data-glyph-height": str(self.bounds.yMax - self.bounds.yMin),
-                "data-glyph-width": str(self.bounds.xMax - self.bounds.xMin),
-                "data-glyph-center-x": str(glyph_center.x),
-                "data-glyph-center-y": str(glyph_center.y),
-                "transform": f"scale(1 -1) translate({-canvas_xmin}, {-canvas_ymax})",
-            },
-        )
-        svg.append(transform_group)
-        transform_group.append(glyph_path)
-
-        origin_group = etree.Element(
-            "g",
-            {
-                "class": "origin",
-                "data-origin-x": str(origin.x),
-                "data-origin-y": str(origin.y),
-                "style": ORIGIN_STYLE,
-            },
-        )
-        svg.append(origin_group)
-
-        origin_group.append(
-            etree.Element(
-                "line",
-                x1=str(origin.x),
-                y1=str(origin.y - 50),
-                x2=str(origin.x),
-                y2=str(origin.y + 50),
+        transform = f"scale(1 -1) translate({-canvas_xmin}, {-canvas_ymax})"
+
+        anchors_markup = "".join(
+            ANCHOR_TMPL.format(
+                x=anchor.x,
+                y=anchor.y,
+                transform=transform,
+                style=ANCHOR_STYLE,
+                label_x=origin.x + anchor.x + 20,
+                label_y=origin.y - anchor.y + 50,
+                label_style=ANCHOR_TEXT_STYLE,
+                name=xml_escape(anchor.name),
             )
+            for anchor in anchors
         )
-        origin_group.append(
-            etree.Element(
-                "line",
-                {
-                    "x1": str(origin.x - 50),
-                    "y1": str(origin.y),
-                    "x2": str(origin.x + 50),
-                    "y2": str(origin.y),
-                },
-            )
+        return SVG_TMPL.format(
+            width=canvas_width,
+            height=canvas_height,
+            css_class=quoteattr(css_class),
+            glyph_name=quoteattr(self.glyph.name),
+            glyph_height=self.bounds.yMax - self.bounds.yMin,
+            glyph_width=self.bounds.xMax - self.bounds.xMin,
+            glyph_center_x=glyph_center.x,
+            glyph_center_y=glyph_center.y,
+            transform=transform,
+            # SVGPathPen output is only numbers, command letters and spaces, so it needs no escaping beyond this guard.
+            d=self.d.replace('"', "&quot;"),
+            origin_x=origin.x,
+            origin_y=origin.y,
+            origin_style=ORIGIN_STYLE,
+            origin_top=origin.y - 50,
+            origin_bottom=origin.y + 50,
+            origin_left=origin.x - 50,
+            origin_right=origin.x + 50,
+            anchors=anchors_markup,
         )
-
-        if anchors:
-            for anchor in anchors:
-                anchor_transform_group = etree.Element(
-                    "g",
-                    {
-                        "class": "anchor",
-                        "data-anchor-x": str(anchor.x),
-                        "data-anchor-y": str(anchor.y),
-                        "transform": f"scale(1 -1) translate({-canvas_xmin}, {-canvas_ymax})",
-                    },
-                )
-                svg.append(anchor_transform_group)
-                anchor_transform_group.append(
-                    etree.Element(
-                        "circle",
-                        {
-                            "cx": str(anchor.x),
-                            "cy": str(anchor.y),
-                            "r": "10",
-                            "style": ANCHOR_STYLE,
-                        },
-                    )
-                )
-                anchor_label = etree.Element(
-                    "text",
-                    {
-                        "x": str(origin.x + anchor.x + 20),
-                        "y": str(origin.y - anchor.y + 50),
-                        "class": "anchor-label",
-                        "style": ANCHOR_TEXT_STYLE,
-                    },
-                )
-                anchor_label.text = anchor.name
-                svg.append(anchor_label)
-        return svg
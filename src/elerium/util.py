@@ -6,7 +6,6 @@ import warnings
 
 from fontTools import agl
 from fontTools.feaLib.parser import Parser as FeaParser
-from fontTools.misc.transform import Transform
 from fontTools.ufoLib import FEATURES_FILENAME
 from ufoLib2.objects import Font, Point
 from ufoLib2.objects.misc import BoundingBox
@@ -16,18 +15,11 @@ from .warnings import GlyphWarning
 
 def equivalent_point(source_point: Point, source_bb: BoundingBox, dest_bb: BoundingBox):
     """Given a source bounding box, and a point relative to that box, compute an "equivalent" point relative to a destination bounding box."""
-    source_width = source_bb.xMax - source_bb.xMin
-    source_height = source_bb.yMax - source_bb.yMin
-    dest_width = dest_bb.xMax - dest_bb.xMin
-    dest_height = dest_bb.yMax - dest_bb.yMin
-
-    affine = (
-        Transform()  # These have to be in what seems like the reverse order, because of how matrix multiplication works.
-        .translate(x=dest_bb.xMin, y=dest_bb.yMin)
-        .scale(x=(dest_width / source_width), y=(dest_height / source_height))
-        .translate(x=-source_bb.xMin, y=-source_bb.yMin)
-    )
-    dest_x, dest_y = affine.transformPoint((source_point.x, source_point.y))
+    scale_x = (dest_bb.xMax - dest_bb.xMin) / (source_bb.xMax - source_bb.xMin)
+    scale_y = (dest_bb.yMax - dest_bb.yMin) / (source_bb.yMax - source_bb.yMin)
+    # The same arithmetic, in the same order, as Transform().translate(dest min).scale(scale_x, scale_y).translate(-source min).
+    dest_x = scale_x * source_point.x + (dest_bb.xMin - scale_x * source_bb.xMin)
+    dest_y = scale_y * source_point.y + (dest_bb.yMin - scale_y * source_bb.yMin)
     return Point(x=int(dest_x), y=int(dest_y))
 
 
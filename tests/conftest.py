@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2025 Rose Davidson <rose@metaclassical.com>
+# SPDX-License-Identifier: MIT
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+
+import fontTools
+import fontTools.feaLib.ast as ast
+import pytest
+
+import elerium.mti_parser
+from elerium.mti_parser import GposParser, Lookup, Parser
+
+DATA_BASE_PATH = pathlib.Path(__file__).parent / "data"
+MTI_DATA_KEY = pytest.StashKey[dict[str, str]]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--mti-cache",
+        action="store_true",
+        default=False,
+        help="reuse GPOS parse results stored in the pytest cache by an earlier run",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("mti_cache") and not config.pluginmanager.hasplugin("cacheprovider"):
+        raise pytest.UsageError("--mti-cache stores its results in the pytest cache, and cannot be used with -p no:cacheprovider")
+
+
+def pytest_sessionstart(session):
+    session.config.stash[MTI_DATA_KEY] = {
+        path.relative_to(DATA_BASE_PATH).with_suffix("").as_posix(): path.read_text(encoding="utf-8")
+        for path in DATA_BASE_PATH.glob("**/*.txt")
+    }
+
+
+@pytest.fixture(scope="session")
+def mti_data(request) -> dict[str, str]:
+    """MTI source text for each file under tests/data, keyed by its path without the .txt suffix."""
+    return request.config.stash[MTI_DATA_KEY]
+
+
+@pytest.fixture
+def make_parser(mti_data: dict[str, str]):
+    """Return a function which creates a fresh Parser with the example GDEF already loaded."""
+    gdef_txt = mti_data["plist/Example GDEF"]
+
+    def make() -> Parser:
+        return Parser().add_GDEF_from_text(gdef_txt)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def parse_gpos(request):
+    """Return a function which parses GPOS MTI source into its lookups and mark classes."""
+    cache_dir = request.config.cache.mkdir("mti") if request.config.getoption("mti_cache") else None
+    # The parser's own source and the versions it builds on are part of the key, so changing any of them invalidates everything cached so far.
+    parser_digest = hashlib.sha256(f"{fontTools.version}\0{elerium.__version__}\0".encode("utf-8"))
+    parser_digest.update(pathlib.Path(elerium.mti_parser.__file__).read_bytes())
+
+    def parse(source: str) -> tuple[list[Lookup], list[ast.MarkClass]]:
+        if cache_dir is not None:
+            digest = parser_digest.copy()
+            digest.update(source.encode("utf-8"))
+            cache_path = cache_dir / f"{digest.hexdigest()}.pickle"
+            try:
+                return pickle.loads(cache_path.read_bytes())
+            except FileNotFoundError:
+                pass
+        parser = GposParser(source)
+        parser.parse()
+        result = (parser.lookups, parser.mark_classes)
+        if cache_dir is not None:
+            # Write under a temporary name and rename it into place, so that concurrent xdist workers never read a partial file.
+            with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as f:
+                pickle.dump(result, f)
+            os.replace(f.name, cache_path)
+        return result
+
+    return parse
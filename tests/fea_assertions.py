@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2025 Rose Davidson <rose@metaclassical.com>
+# SPDX-License-Identifier: MIT
+import dataclasses
+import difflib
+import functools
+import sys
+
+import fontTools.feaLib.ast as ast
+import pytest
+
+from elerium.mti_parser import Lookup
+
+
+@functools.lru_cache(maxsize=None)
+def gname(glyph: str) -> ast.GlyphName:
+    """Shared GlyphName for use in expected values; these are never mutated."""
+    return ast.GlyphName(sys.intern(glyph))
+
+
+def feaify(lookup: Lookup) -> list[str]:
+    return [s.asFea() for s in lookup.statements]
+
+
+def assert_fea_equal(actual: list[str], expected: list[str]):
+    if actual != expected:
+        pytest.fail("\n".join(difflib.unified_diff(expected, actual, "expected", "actual", lineterm="")), pytrace=False)
+
+
+def assert_single_lookup(lookups: list[Lookup], expected: Lookup):
+    """Compare a parsed lookup's metadata, then the fea text of its statements, failing with a diff of the latter."""
+    assert len(lookups) == 1
+    (actual,) = lookups
+    assert dataclasses.replace(actual, statements=[]) == dataclasses.replace(expected, statements=[])
+    assert_fea_equal(feaify(actual), feaify(expected))
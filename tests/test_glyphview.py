@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2025 Rose Davidson <rose@metaclassical.com>
+# SPDX-License-Identifier: MIT
+import html.parser
+import pathlib
+import shutil
+
+import pytest
+import ufoLib2
+from webob.request import Request
+
+from elerium.glyphview import Viewer
+
+TESTBORETO_PATH = pathlib.Path(__file__).parent / "data" / "ufo" / "Testboreto.ufo"
+MARK_FEATURE = """
+markClass [acutecomb gravecomb] <anchor 0 700> @top;
+lookup mark_top {
+    pos base [A O] <anchor 300 700> mark @top;
+} mark_top;
+feature mark {
+    script latn;
+    lookup mark_top;
+} mark;
+"""
+# Names which must come out of the templates escaped.
+FONT_NAME = "Test & <Boreto>"
+GLYPH_NAME = "x&<y"
+VOID_ELEMENTS = frozenset(("meta", "link", "hr", "br", "img", "input"))
+
+
+class TagBalanceChecker(html.parser.HTMLParser):
+    """Fails if any non-void element is left open or closed out of order."""
+
+    def __init__(self):
+        super().__init__()
+        self.open_tags = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in VOID_ELEMENTS:
+            self.open_tags.append(tag)
+
+    def handle_endtag(self, tag):
+        assert self.open_tags and self.open_tags[-1] == tag, f"</{tag}> closes {self.open_tags[-1:]}"
+        self.open_tags.pop()
+
+    def close(self):
+        super().close()
+        assert not self.open_tags, f"unclosed tags: {self.open_tags}"
+
+
+def assert_well_formed(page: str):
+    checker = TagBalanceChecker()
+    checker.feed(page)
+    checker.close()
+
+
+@pytest.fixture(scope="module")
+def viewer_ufo(tmp_path_factory):
+    ufo_path = tmp_path_factory.mktemp("viewer") / "Testboreto.ufo"
+    shutil.copytree(TESTBORETO_PATH, ufo_path)
+    with (ufo_path / "features.fea").open("a", encoding="utf-8") as fea_file:
+        fea_file.write(MARK_FEATURE)
+    ufo = ufoLib2.Font.open(ufo_path)
+    ufo.info.postscriptFullName = FONT_NAME
+    ufo.newGlyph(GLYPH_NAME).unicodes = [0xE000]
+    return ufo
+
+
+@pytest.fixture(scope="module")
+def viewer(viewer_ufo):
+    return Viewer(viewer_ufo)
+
+
+@pytest.fixture(scope="module")
+def featureless_viewer(tmp_path_factory):
+    ufo_path = tmp_path_factory.mktemp("featureless") / "Testboreto.ufo"
+    shutil.copytree(TESTBORETO_PATH, ufo_path, ignore=shutil.ignore_patterns("features.fea"))
+    return Viewer(ufoLib2.Font.open(ufo_path))
+
+
+@pytest.mark.parametrize(
+    ["path", "status"],
+    [
+        ("/", 200),
+        ("/glyphs", 200),
+        ("/glyphs?script=Latn", 200),
+        ("/lookup?feature=mark&name=mark_top", 200),
+        ("/lookup?feature=mark&name=missing", 400),
+        ("/missing", 404),
+    ],
+)
+def test_status(viewer: Viewer, path: str, status: int):
+    response = Request.blank(path).get_response(viewer)
+    assert response.status_code == status
+    if status == 200:
+        assert_well_formed(response.text)
+
+
+def test_mark_lookup(viewer: Viewer):
+    page = Request.blank("/lookup?feature=mark&name=mark_top").get_response(viewer).text
+    assert "<h1>mark_top</h1>" in page
+    # One card per mark glyph, and one per base glyph with the mark anchor drawn.
+    assert page.count('class="anchor"') == 4
+
+
+def test_glyphs_streamed(viewer: Viewer):
+    response = Request.blank("/glyphs").get_response(viewer)
+    assert not isinstance(response.app_iter, list)
+    page = b"".join(response.app_iter).decode("utf-8")
+    assert_well_formed(page)
+    assert page.count('class="glyphname"') == len(viewer.font.typeable_glyphs_ordered)
+
+
+@pytest.mark.parametrize("path", ["/", "/glyphs", "/lookup?feature=mark&name=mark_top"])
+def test_debug(viewer_ufo, path: str):
+    response = Request.blank(path).get_response(Viewer(viewer_ufo, debug=True))
+    assert response.status_code == 200
+    assert_well_formed(response.text)
+
+
+def test_names_escaped(viewer: Viewer):
+    info_page = Request.blank("/").get_response(viewer).text
+    assert FONT_NAME not in info_page
+    assert "Test &amp; &lt;Boreto&gt;" in info_page
+
+    glyphs_page = Request.blank("/glyphs").get_response(viewer).text
+    assert GLYPH_NAME not in glyphs_page
+    assert '<span class="glyphname">x&amp;&lt;y</span>' in glyphs_page
+    assert 'data-glyph-name="x&amp;&lt;y"' in glyphs_page
+
+
+@pytest.mark.parametrize("path", ["/", "/glyphs"])
+def test_featureless_font(featureless_viewer: Viewer, path: str):
+    response = Request.blank(path).get_response(featureless_viewer)
+    assert response.status_code == 200
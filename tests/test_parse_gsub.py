@@ -1,467 +1,436 @@
 # SPDX-FileCopyrightText: 2025 Rose Davidson <rose@metaclassical.com>
 # SPDX-License-Identifier: MIT
-import pathlib
+from collections.abc import Callable
 
 import fontTools.feaLib.ast as ast
 import pytest
+from fea_assertions import assert_single_lookup, gname
 
-from elerium.mti_parser import GsubParser, Lookup, LookupFlag, Parser
+from elerium.mti_parser import GsubParser, Lookup, LookupFlag
 from elerium.warnings import FeatureSyntaxWarning
 
-DATA_BASE_PATH = pathlib.Path(__file__).parent / "data"
 
+def GC(*glyphs: str) -> ast.GlyphClass:
+    return ast.GlyphClass(list(glyphs))
 
-def data_loader(example_name: str):
-    return (DATA_BASE_PATH / example_name).with_suffix(".txt").read_text()
 
-
-def feaify(lookup: Lookup):
-    lookup.statements = [s.asFea() for s in lookup.statements]
-    return lookup
-
-
-def param_ids(val):
-    if isinstance(val, str):
-        return val
-    if isinstance(val, Lookup):
-        return str(val.lookup_id).replace("-", "_")
-    return None
-
-
-@pytest.mark.parametrize(
-    ["mti_file", "expected"],
-    [
-        (
-            "mti/gsubsingle",
-            Lookup(
-                lookup_id="GSUB_alt-fractions",
-                statements=[
-                    ast.SingleSubstStatement(
-                        glyphs=[ast.GlyphClass(glyphs=["onehalf", "onequarter", "threequarters"])],
-                        replace=[ast.GlyphClass(glyphs=["onehalf.alt", "onequarter.alt", "threequarters.alt"])],
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    )
-                ],
-            ),
+# Expected values are wrapped in factories, so they are only built for the cases that actually run.
+GSUB_FRAGMENTS = (
+    (
+        "mti/gsubsingle",
+        lambda: Lookup(
+            lookup_id="GSUB_alt-fractions",
+            statements=[
+                ast.SingleSubstStatement(
+                    glyphs=[GC("onehalf", "onequarter", "threequarters")],
+                    replace=[GC("onehalf.alt", "onequarter.alt", "threequarters.alt")],
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                )
+            ],
         ),
-        (
-            "mti/gsubmultiple",
-            Lookup(
-                lookup_id="GSUB_replace-akhand-telugu",
-                statements=[
-                    ast.MultipleSubstStatement(
-                        glyph=ast.GlyphName(glyph="kassevoweltelugu"),
-                        replacement=[ast.GlyphClass(glyphs=["kaivoweltelugu", "ssasubscripttelugu"])],
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.MultipleSubstStatement(
-                        glyph=ast.GlyphName(glyph="janyevoweltelugu"),
-                        replacement=[ast.GlyphClass(glyphs=["jaivoweltelugu", "nyasubscripttelugu"])],
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                ],
-            ),
+    ),
+    (
+        "mti/gsubmultiple",
+        lambda: Lookup(
+            lookup_id="GSUB_replace-akhand-telugu",
+            statements=[
+                ast.MultipleSubstStatement(
+                    glyph=gname("kassevoweltelugu"),
+                    replacement=[GC("kaivoweltelugu", "ssasubscripttelugu")],
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.MultipleSubstStatement(
+                    glyph=gname("janyevoweltelugu"),
+                    replacement=[GC("jaivoweltelugu", "nyasubscripttelugu")],
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+            ],
         ),
-        (
-            "mti/gsubalternate",
-            Lookup(
-                lookup_id="GSUB_27",
-                statements=[
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("zero"),
-                        replacement=ast.GlyphClass(
-                            ["uniF730", "uniE13D", "uniE13E", "uniE13A", "uni2070", "uni2080", "uniE13B", "uniE139", "uniE13C"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("one"),
-                        replacement=ast.GlyphClass(
-                            ["uniF731", "uniE0F3", "uniE0F4", "uniE0F1", "uni00B9", "uni2081", "uniE0F2", "uniE0F0", "uniE0F8"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("two"),
-                        replacement=ast.GlyphClass(
-                            ["uniF732", "uniE133", "uniE134", "uniE131", "uni00B2", "uni2082", "uniE132", "uniE130", "uniE0F9"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("three"),
-                        replacement=ast.GlyphClass(
-                            ["uniF733", "uniE12B", "uniE12C", "uniE129", "uni00B3", "uni2083", "uniE12A", "uniE128"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("four"),
-                        replacement=ast.GlyphClass(
-                            ["uniF734", "uniE0D4", "uniE0D5", "uniE0D2", "uni2074", "uni2084", "uniE0D3", "uniE0D1"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("five"),
-                        replacement=ast.GlyphClass(
-                            ["uniF735", "uniE0CD", "uniE0CE", "uniE0CB", "uni2075", "uni2085", "uniE0CC", "uniE0CA"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("six"),
-                        replacement=ast.GlyphClass(
-                            ["uniF736", "uniE121", "uniE122", "uniE11F", "uni2076", "uni2086", "uniE120", "uniE11E"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("seven"),
-                        replacement=ast.GlyphClass(
-                            ["uniF737", "uniE11C", "uniE11D", "uniE11A", "uni2077", "uni2087", "uniE11B", "uniE119"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("eight"),
-                        replacement=ast.GlyphClass(
-                            ["uniF738", "uniE0C0", "uniE0C1", "uniE0BE", "uni2078", "uni2088", "uniE0BF", "uniE0BD"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("nine"),
-                        replacement=ast.GlyphClass(
-                            ["uniF739", "uniE0EC", "uniE0ED", "uniE0EA", "uni2079", "uni2089", "uniE0EB", "uniE0E9"]
-                        ),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("guilsinglleft"),
-                        replacement=ast.GlyphClass(["uniE0DB", "uniE0DC"]),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                    ast.AlternateSubstStatement(
-                        glyph=ast.GlyphName("guilsinglright"),
-                        replacement=ast.GlyphClass(["uniE0DD", "uniE0DE"]),
-                        prefix=[],
-                        suffix=[],
-                    ),
-                ],
-            ),
+    ),
+    (
+        "mti/gsubalternate",
+        lambda: Lookup(
+            lookup_id="GSUB_27",
+            statements=[
+                ast.AlternateSubstStatement(
+                    glyph=gname("zero"),
+                    replacement=GC("uniF730", "uniE13D", "uniE13E", "uniE13A", "uni2070", "uni2080", "uniE13B", "uniE139", "uniE13C"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("one"),
+                    replacement=GC("uniF731", "uniE0F3", "uniE0F4", "uniE0F1", "uni00B9", "uni2081", "uniE0F2", "uniE0F0", "uniE0F8"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("two"),
+                    replacement=GC("uniF732", "uniE133", "uniE134", "uniE131", "uni00B2", "uni2082", "uniE132", "uniE130", "uniE0F9"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("three"),
+                    replacement=GC("uniF733", "uniE12B", "uniE12C", "uniE129", "uni00B3", "uni2083", "uniE12A", "uniE128"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("four"),
+                    replacement=GC("uniF734", "uniE0D4", "uniE0D5", "uniE0D2", "uni2074", "uni2084", "uniE0D3", "uniE0D1"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("five"),
+                    replacement=GC("uniF735", "uniE0CD", "uniE0CE", "uniE0CB", "uni2075", "uni2085", "uniE0CC", "uniE0CA"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("six"),
+                    replacement=GC("uniF736", "uniE121", "uniE122", "uniE11F", "uni2076", "uni2086", "uniE120", "uniE11E"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("seven"),
+                    replacement=GC("uniF737", "uniE11C", "uniE11D", "uniE11A", "uni2077", "uni2087", "uniE11B", "uniE119"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("eight"),
+                    replacement=GC("uniF738", "uniE0C0", "uniE0C1", "uniE0BE", "uni2078", "uni2088", "uniE0BF", "uniE0BD"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("nine"),
+                    replacement=GC("uniF739", "uniE0EC", "uniE0ED", "uniE0EA", "uni2079", "uni2089", "uniE0EB", "uniE0E9"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("guilsinglleft"),
+                    replacement=GC("uniE0DB", "uniE0DC"),
+                    prefix=[],
+                    suffix=[],
+                ),
+                ast.AlternateSubstStatement(
+                    glyph=gname("guilsinglright"),
+                    replacement=GC("uniE0DD", "uniE0DE"),
+                    prefix=[],
+                    suffix=[],
+                ),
+            ],
         ),
-        (
-            "mti/gsubligature",
-            Lookup(
-                lookup_id="GSUB_latinLigatures",
-                statements=[
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("I"), ast.GlyphName("J")],
-                        replacement=ast.GlyphName("IJ"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("f"), ast.GlyphName("i")],
-                        replacement=ast.GlyphName("ffi"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("f"), ast.GlyphName("l")],
-                        replacement=ast.GlyphName("ffl"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("f"), ast.GlyphName("t")],
-                        replacement=ast.GlyphName("fft"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("f"), ast.GlyphName("b")],
-                        replacement=ast.GlyphName("ffb"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("f"), ast.GlyphName("h")],
-                        replacement=ast.GlyphName("ffh"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("f"), ast.GlyphName("k")],
-                        replacement=ast.GlyphName("ffk"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("i")],
-                        replacement=ast.GlyphName("fi"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("l")],
-                        replacement=ast.GlyphName("fl"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("f")],
-                        replacement=ast.GlyphName("ff"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("t")],
-                        replacement=ast.GlyphName("ft"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("b")],
-                        replacement=ast.GlyphName("fb"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("h")],
-                        replacement=ast.GlyphName("fh"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("k")],
-                        replacement=ast.GlyphName("fk"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("f"), ast.GlyphName("j")],
-                        replacement=ast.GlyphName("fj"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("i"), ast.GlyphName("j")],
-                        replacement=ast.GlyphName("ij"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("t"), ast.GlyphName("t")],
-                        replacement=ast.GlyphName("tt"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                    ast.LigatureSubstStatement(
-                        glyphs=[ast.GlyphName("Ismall"), ast.GlyphName("Jsmall")],
-                        replacement=ast.GlyphName("IJsmall"),
-                        prefix=[],
-                        suffix=[],
-                        forceChain=False,
-                    ),
-                ],
-            ),
+    ),
+    (
+        "mti/gsubligature",
+        lambda: Lookup(
+            lookup_id="GSUB_latinLigatures",
+            statements=[
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("I"), gname("J")],
+                    replacement=gname("IJ"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("f"), gname("i")],
+                    replacement=gname("ffi"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("f"), gname("l")],
+                    replacement=gname("ffl"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("f"), gname("t")],
+                    replacement=gname("fft"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("f"), gname("b")],
+                    replacement=gname("ffb"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("f"), gname("h")],
+                    replacement=gname("ffh"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("f"), gname("k")],
+                    replacement=gname("ffk"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("i")],
+                    replacement=gname("fi"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("l")],
+                    replacement=gname("fl"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("f")],
+                    replacement=gname("ff"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("t")],
+                    replacement=gname("ft"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("b")],
+                    replacement=gname("fb"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("h")],
+                    replacement=gname("fh"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("k")],
+                    replacement=gname("fk"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("f"), gname("j")],
+                    replacement=gname("fj"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("i"), gname("j")],
+                    replacement=gname("ij"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("t"), gname("t")],
+                    replacement=gname("tt"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+                ast.LigatureSubstStatement(
+                    glyphs=[gname("Ismall"), gname("Jsmall")],
+                    replacement=gname("IJsmall"),
+                    prefix=[],
+                    suffix=[],
+                    forceChain=False,
+                ),
+            ],
         ),
-        (
-            "nototools/consub1",
-            Lookup(
-                lookup_id="GSUB_testLookupCtx",
-                depends_on=["GSUB_testLookupSub"],
-                statements=[
-                    # sub b' lookup GSUB_testLookupSub a';
-                    ast.ChainContextSubstStatement(
-                        glyphs=[ast.GlyphName("b"), ast.GlyphName("a")],
-                        lookups=[[ast.LookupBlock(name="GSUB_testLookupSub")], None],
-                        prefix=[],
-                        suffix=[],
-                    )
-                ],
-            ),
+    ),
+    (
+        "nototools/consub1",
+        lambda: Lookup(
+            lookup_id="GSUB_testLookupCtx",
+            depends_on=["GSUB_testLookupSub"],
+            statements=[
+                # sub b' lookup GSUB_testLookupSub a';
+                ast.ChainContextSubstStatement(
+                    glyphs=[gname("b"), gname("a")],
+                    lookups=[[ast.LookupBlock(name="GSUB_testLookupSub")], None],
+                    prefix=[],
+                    suffix=[],
+                )
+            ],
         ),
-        (
-            "nototools/consub2",
-            Lookup(
-                lookup_id="GSUB_testLookupCtx",
-                depends_on=["GSUB_testLookupSub"],
-                statements=[
-                    # sub [a d]' lookup GSUB_testLookupSub b' c' [a d]';
-                    ast.ChainContextSubstStatement(
-                        glyphs=[ast.GlyphClass(["a", "d"]), ast.GlyphName("b"), ast.GlyphName("c"), ast.GlyphClass(["a", "d"])],
-                        lookups=[[ast.LookupBlock(name="GSUB_testLookupSub")], None, None, None],
-                        prefix=[],
-                        suffix=[],
-                    )
-                ],
-            ),
+    ),
+    (
+        "nototools/consub2",
+        lambda: Lookup(
+            lookup_id="GSUB_testLookupCtx",
+            depends_on=["GSUB_testLookupSub"],
+            statements=[
+                # sub [a d]' lookup GSUB_testLookupSub b' c' [a d]';
+                ast.ChainContextSubstStatement(
+                    glyphs=[GC("a", "d"), gname("b"), gname("c"), GC("a", "d")],
+                    lookups=[[ast.LookupBlock(name="GSUB_testLookupSub")], None, None, None],
+                    prefix=[],
+                    suffix=[],
+                )
+            ],
         ),
-        (
-            "mti/chained-glyph",
-            Lookup(
-                lookup_id="GSUB_raucontext-sinh",
-                flags=LookupFlag.MARK_ATTACHMENT_CLASS_FILTER,
-                mark_attachment_class=2,
-                depends_on=["GSUB_u2aelow-sinh"],
-                statements=[
-                    # sub rakarsinh uvowelsignsinh' lookup GSUB_u2aelow-sinh;
-                    # sub rakarsinh uuvowelsignsinh' lookup GSUB_u2aelow-sinh;
-                    ast.ChainContextSubstStatement(
-                        glyphs=[ast.GlyphName("uvowelsignsinh")],
-                        lookups=[[ast.LookupBlock(name="GSUB_u2aelow-sinh")]],
-                        prefix=[ast.GlyphName("rakarsinh")],
-                        suffix=[],
-                    ),
-                    ast.ChainContextSubstStatement(
-                        glyphs=[ast.GlyphName("uuvowelsignsinh")],
-                        lookups=[[ast.LookupBlock(name="GSUB_u2aelow-sinh")]],
-                        prefix=[ast.GlyphName("rakarsinh")],
-                        suffix=[],
-                    ),
-                ],
-            ),
+    ),
+    (
+        "mti/chained-glyph",
+        lambda: Lookup(
+            lookup_id="GSUB_raucontext-sinh",
+            flags=LookupFlag.MARK_ATTACHMENT_CLASS_FILTER,
+            mark_attachment_class=2,
+            depends_on=["GSUB_u2aelow-sinh"],
+            statements=[
+                # sub rakarsinh uvowelsignsinh' lookup GSUB_u2aelow-sinh;
+                # sub rakarsinh uuvowelsignsinh' lookup GSUB_u2aelow-sinh;
+                ast.ChainContextSubstStatement(
+                    glyphs=[gname("uvowelsignsinh")],
+                    lookups=[[ast.LookupBlock(name="GSUB_u2aelow-sinh")]],
+                    prefix=[gname("rakarsinh")],
+                    suffix=[],
+                ),
+                ast.ChainContextSubstStatement(
+                    glyphs=[gname("uuvowelsignsinh")],
+                    lookups=[[ast.LookupBlock(name="GSUB_u2aelow-sinh")]],
+                    prefix=[gname("rakarsinh")],
+                    suffix=[],
+                ),
+            ],
         ),
-        (
-            "nototools/chainsub1",
-            Lookup(
-                lookup_id="GSUB_testLookupCtx",
-                depends_on=["GSUB_testLookupSub"],
-                statements=[
-                    # sub b a' lookup GSUB_testLookupSub c;
-                    ast.ChainContextSubstStatement(
-                        glyphs=[ast.GlyphName("a")],
-                        lookups=[[ast.LookupBlock(name="GSUB_testLookupSub")]],
-                        prefix=[ast.GlyphName("b")],
-                        suffix=[ast.GlyphName("c")],
-                    )
-                ],
-            ),
+    ),
+    (
+        "nototools/chainsub1",
+        lambda: Lookup(
+            lookup_id="GSUB_testLookupCtx",
+            depends_on=["GSUB_testLookupSub"],
+            statements=[
+                # sub b a' lookup GSUB_testLookupSub c;
+                ast.ChainContextSubstStatement(
+                    glyphs=[gname("a")],
+                    lookups=[[ast.LookupBlock(name="GSUB_testLookupSub")]],
+                    prefix=[gname("b")],
+                    suffix=[gname("c")],
+                )
+            ],
         ),
-        (
-            "chainedclass",
-            Lookup(
-                lookup_id="GSUB_contrived",
-                depends_on=["GSUB_somelookup", "GSUB_otherlookup"],
-                statements=[
-                    # sub z [a e]' [a e]' lookup GSUB_somelookup [one three five];
-                    ast.ChainContextSubstStatement(
-                        glyphs=[ast.GlyphClass(glyphs=["a", "e"]), ast.GlyphClass(glyphs=["a", "e"])],
-                        lookups=[None, [ast.LookupBlock(name="GSUB_somelookup")]],
-                        prefix=[ast.GlyphName("z")],
-                        suffix=[ast.GlyphClass(glyphs=["one", "three", "five"])],
-                    ),
-                    # sub y y [b c d f]' lookup GSUB_somelookup [a e]' [b c d f]' lookup GSUB_otherlookup [two four six];
-                    ast.ChainContextSubstStatement(
-                        glyphs=[
-                            ast.GlyphClass(glyphs=["b", "c", "d", "f"]),
-                            ast.GlyphClass(glyphs=["a", "e"]),
-                            ast.GlyphClass(glyphs=["b", "c", "d", "f"]),
-                        ],
-                        lookups=[[ast.LookupBlock(name="GSUB_somelookup")], None, [ast.LookupBlock(name="GSUB_otherlookup")]],
-                        prefix=[ast.GlyphName("y"), ast.GlyphName("y")],
-                        suffix=[ast.GlyphClass(glyphs=["two", "four", "six"])],
-                    ),
-                ],
-            ),
+    ),
+    (
+        "chainedclass",
+        lambda: Lookup(
+            lookup_id="GSUB_contrived",
+            depends_on=["GSUB_somelookup", "GSUB_otherlookup"],
+            statements=[
+                # sub z [a e]' [a e]' lookup GSUB_somelookup [one three five];
+                ast.ChainContextSubstStatement(
+                    glyphs=[GC("a", "e"), GC("a", "e")],
+                    lookups=[None, [ast.LookupBlock(name="GSUB_somelookup")]],
+                    prefix=[gname("z")],
+                    suffix=[GC("one", "three", "five")],
+                ),
+                # sub y y [b c d f]' lookup GSUB_somelookup [a e]' [b c d f]' lookup GSUB_otherlookup [two four six];
+                ast.ChainContextSubstStatement(
+                    glyphs=[
+                        GC("b", "c", "d", "f"),
+                        GC("a", "e"),
+                        GC("b", "c", "d", "f"),
+                    ],
+                    lookups=[[ast.LookupBlock(name="GSUB_somelookup")], None, [ast.LookupBlock(name="GSUB_otherlookup")]],
+                    prefix=[gname("y"), gname("y")],
+                    suffix=[GC("two", "four", "six")],
+                ),
+            ],
         ),
-        (
-            "mti/chainedcoverage",
-            Lookup(
-                lookup_id="GSUB_slashcontext",
-                depends_on=["GSUB_slashTofraction"],
-                statements=[
-                    # "sub [zero one two three four five six seven eight nine] slash' lookup GSUB_slashTofraction [zero one two three four five six seven eight nine];"
-                    ast.ChainContextSubstStatement(
-                        glyphs=[ast.GlyphName("slash")],
-                        lookups=[[ast.LookupBlock(name="GSUB_slashTofraction")]],
-                        prefix=[ast.GlyphClass(["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"])],
-                        suffix=[ast.GlyphClass(["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"])],
-                    ),
-                ],
-            ),
+    ),
+    (
+        "mti/chainedcoverage",
+        lambda: Lookup(
+            lookup_id="GSUB_slashcontext",
+            depends_on=["GSUB_slashTofraction"],
+            statements=[
+                # "sub [zero one two three four five six seven eight nine] slash' lookup GSUB_slashTofraction [zero one two three four five six seven eight nine];"
+                ast.ChainContextSubstStatement(
+                    glyphs=[gname("slash")],
+                    lookups=[[ast.LookupBlock(name="GSUB_slashTofraction")]],
+                    prefix=[GC("zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine")],
+                    suffix=[GC("zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine")],
+                ),
+            ],
         ),
-        (
-            "mti/gsubreversechanined",  # lol typo
-            Lookup(
-                lookup_id="GSUB_arabicReverse",
-                flags=LookupFlag.RIGHT_TO_LEFT | LookupFlag.IGNORE_MARKS,
-                statements=[
-                    # rsub [bayi1 jeemi1 kafi1 ghafi1 laami1 kafm1 ghafm1 laamm1] [rayf2 reyf2 zayf2 yayf2]' by [rayf1 reyf1 zayf1 yayf1];
-                    ast.ReverseChainSingleSubstStatement(
-                        old_prefix=[ast.GlyphClass(["bayi1", "jeemi1", "kafi1", "ghafi1", "laami1", "kafm1", "ghafm1", "laamm1"])],
-                        old_suffix=[],
-                        glyphs=[ast.GlyphClass(["rayf2", "reyf2", "zayf2", "yayf2"])],
-                        replacements=[ast.GlyphClass(["rayf1", "reyf1", "zayf1", "yayf1"])],
-                    ),
-                    # rsub [bayi1 kafi1 ghafi1 laami1 kafm1 ghafm1 laamm1 fayi1] [hamzayehf2 hamzayeharabf2 ayehf2 yehf2]' by [hamzayehf1 hamzayeharabf1 ayehf1 yehf1];
-                    ast.ReverseChainSingleSubstStatement(
-                        old_prefix=[ast.GlyphClass(["bayi1", "fayi1", "kafi1", "ghafi1", "laami1", "kafm1", "ghafm1", "laamm1"])],
-                        old_suffix=[],
-                        glyphs=[ast.GlyphClass(["hamzayehf2", "hamzayeharabf2", "ayehf2", "yehf2"])],
-                        replacements=[ast.GlyphClass(["hamzayehf1", "hamzayeharabf1", "ayehf1", "yehf1"])],
-                    ),
-                    # rsub [dal del zal]' [ray rey zay yay] by [dal1 del1 zal1];
-                    ast.ReverseChainSingleSubstStatement(
-                        old_prefix=[],
-                        old_suffix=[ast.GlyphClass(["ray", "rey", "zay", "yay"])],
-                        glyphs=[ast.GlyphClass(["dal", "del", "zal"])],
-                        replacements=[ast.GlyphClass(["dal1", "del1", "zal1"])],
-                    ),
-                ],
-            ),
+    ),
+    (
+        "mti/gsubreversechanined",  # lol typo
+        lambda: Lookup(
+            lookup_id="GSUB_arabicReverse",
+            flags=LookupFlag.RIGHT_TO_LEFT | LookupFlag.IGNORE_MARKS,
+            statements=[
+                # rsub [bayi1 jeemi1 kafi1 ghafi1 laami1 kafm1 ghafm1 laamm1] [rayf2 reyf2 zayf2 yayf2]' by [rayf1 reyf1 zayf1 yayf1];
+                ast.ReverseChainSingleSubstStatement(
+                    old_prefix=[GC("bayi1", "jeemi1", "kafi1", "ghafi1", "laami1", "kafm1", "ghafm1", "laamm1")],
+                    old_suffix=[],
+                    glyphs=[GC("rayf2", "reyf2", "zayf2", "yayf2")],
+                    replacements=[GC("rayf1", "reyf1", "zayf1", "yayf1")],
+                ),
+                # rsub [bayi1 kafi1 ghafi1 laami1 kafm1 ghafm1 laamm1 fayi1] [hamzayehf2 hamzayeharabf2 ayehf2 yehf2]' by [hamzayehf1 hamzayeharabf1 ayehf1 yehf1];
+                ast.ReverseChainSingleSubstStatement(
+                    old_prefix=[GC("bayi1", "fayi1", "kafi1", "ghafi1", "laami1", "kafm1", "ghafm1", "laamm1")],
+                    old_suffix=[],
+                    glyphs=[GC("hamzayehf2", "hamzayeharabf2", "ayehf2", "yehf2")],
+                    replacements=[GC("hamzayehf1", "hamzayeharabf1", "ayehf1", "yehf1")],
+                ),
+                # rsub [dal del zal]' [ray rey zay yay] by [dal1 del1 zal1];
+                ast.ReverseChainSingleSubstStatement(
+                    old_prefix=[],
+                    old_suffix=[GC("ray", "rey", "zay", "yay")],
+                    glyphs=[GC("dal", "del", "zal")],
+                    replacements=[GC("dal1", "del1", "zal1")],
+                ),
+            ],
         ),
-    ],
-    ids=param_ids,
+    ),
+)
+
+GSUB_FRAGMENT_IDS = tuple(mti_file for mti_file, _ in GSUB_FRAGMENTS)
+
+
+@pytest.mark.parametrize(
+    ("mti_file", "expected_factory"),
+    GSUB_FRAGMENTS,
+    ids=GSUB_FRAGMENT_IDS,
 )
-def test_gsub_fragment(mti_file: str, expected: Lookup):
-    parser = GsubParser(data_loader(mti_file))
+def test_gsub_fragment(mti_data, mti_file: str, expected_factory: Callable[[], Lookup]):
+    parser = GsubParser(mti_data[mti_file])
 
     parser.parse()
-    assert len(parser.lookups) == 1
-    actual = feaify(parser.lookups[0])
-    expected = feaify(expected)
-    assert actual == expected
+    assert_single_lookup(parser.lookups, expected_factory())
 
 
-def test_out_of_order_context_lookups():
+def test_out_of_order_context_lookups(mti_data):
     expected = Lookup(
         lookup_id="GSUB_ooochaining",
         depends_on=["GSUB_sublookup", "GSUB_otherlookup", "GSUB_thirdlookup"],
@@ -470,31 +439,28 @@ def test_out_of_order_context_lookups():
                 "# Lookup GSUB_ooochaining has syntax that cannot be expressed in ADFKO: 2,sublookup 1,otherlookup. If the order of application matters here, you will need to restructure this rule.",
             ),
             ast.ChainContextSubstStatement(
-                glyphs=[ast.GlyphClass(["A", "B", "C", "D"]), ast.GlyphClass(["Z", "Y", "X"])],
+                glyphs=[GC("A", "B", "C", "D"), GC("Z", "Y", "X")],
                 lookups=[[ast.LookupBlock(name="GSUB_otherlookup")], [ast.LookupBlock(name="GSUB_sublookup")]],
-                prefix=[ast.GlyphClass(["two", "four", "six"]), ast.GlyphClass(["one", "three", "five"])],
-                suffix=[ast.GlyphClass(["two", "four", "six"])],
+                prefix=[GC("two", "four", "six"), GC("one", "three", "five")],
+                suffix=[GC("two", "four", "six")],
             ),
             ast.Comment(
                 "# Lookup GSUB_ooochaining has syntax that cannot be expressed in ADFKO: 2,sublookup 1,thirdlookup. If the order of application matters here, you will need to restructure this rule.",
             ),
             ast.ChainContextSubstStatement(
-                glyphs=[ast.GlyphClass(["seven", "eight", "nine"]), ast.GlyphClass(["one", "two", "three"])],
+                glyphs=[GC("seven", "eight", "nine"), GC("one", "two", "three")],
                 lookups=[[ast.LookupBlock(name="GSUB_thirdlookup")], [ast.LookupBlock(name="GSUB_sublookup")]],
-                prefix=[ast.GlyphClass(["a", "c", "e"])],
-                suffix=[ast.GlyphClass(["x", "y", "z"])],
+                prefix=[GC("a", "c", "e")],
+                suffix=[GC("x", "y", "z")],
             ),
         ],
     )
-    parser = GsubParser(data_loader("ooo_chaining"))
+    parser = GsubParser(mti_data["ooo_chaining"])
 
     with pytest.warns(FeatureSyntaxWarning):
         parser.parse()
 
-    assert len(parser.lookups) == 1
-    actual = feaify(parser.lookups[0])
-    expected = feaify(expected)
-    assert actual == expected
+    assert_single_lookup(parser.lookups, expected)
 
 
 CYRL_GREK_FEATURE = """\
@@ -535,16 +501,15 @@ feature test {
 """
 
 
-def test_multi_script_lookups():
+def test_multi_script_lookups(mti_data, make_parser):
     # In this example, a lookup is used by multiple scripts.
     # cyrl and grek both use feature 0.
     # latn with the default language uses feature 1.
     # latin with the DEU (German) language uses feature 2.
     # But all three features reference the same lookup.
     # The parser should produce one feature with both cyrl and grek, one for latn, and one for latn DEU.
-    parser = Parser()
-    parser.add_GDEF(DATA_BASE_PATH / "plist" / "Example GDEF.txt")
-    parser.add_GSUB(DATA_BASE_PATH / "multiscriptlookup.txt")
+    parser = make_parser()
+    parser.add_GSUB_from_text(mti_data["multiscriptlookup"])
 
     fea_ast = parser.parse()
     assert isinstance(fea_ast, ast.FeatureFile)
@@ -2,9 +2,12 @@
 # SPDX-License-Identifier: MIT
 import pathlib
 
+from fea_assertions import assert_fea_equal
+
 from elerium.mti_parser import Parser
 
 DATA_BASE_PATH = pathlib.Path(__file__).parent / "data"
+EXPECTED_FEA = (DATA_BASE_PATH / "plist/Example.fea").read_text(encoding="utf-8")
 
 
 def test_parse_plist():
@@ -16,5 +19,5 @@ def test_parse_plist():
 
     result = parser.parse()
     actual = result.asFea()
-    expected = (DATA_BASE_PATH / "plist/Example.fea").read_text()
-    assert actual == expected
+    assert_fea_equal(actual.splitlines(), EXPECTED_FEA.splitlines())
+    assert actual == EXPECTED_FEA  # catches what a line diff can't, such as the trailing newline
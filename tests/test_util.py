@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: 2025 Rose Davidson <rose@metaclassical.com>
 # SPDX-License-Identifier: MIT
 import pathlib
-from collections.abc import Sequence
+from collections.abc import Callable
 from contextlib import AbstractContextManager, ExitStack, nullcontext
 
 import pytest
@@ -12,39 +12,60 @@ from ufoLib2.objects.misc import BoundingBox
 from elerium.util import GlyphWarning, equivalent_point, find_glyph_codepoints
 
 TESTBORETO_PATH = pathlib.Path(__file__).parent / "data" / "ufo" / "Testboreto.ufo"
+NARROW_BB = BoundingBox(xMin=30, xMax=40, yMin=0, yMax=60)
 
 
-def test_equivalent_point():
-    source_bb = BoundingBox(xMin=30, xMax=40, yMin=0, yMax=60)
-    source_point = Point(x=25, y=30)  # five units to the left of the midpoint of the left side
-    dest_bb = BoundingBox(xMin=30, xMax=60, yMin=0, yMax=60)
-
-    expected = Point(x=15, y=30)  # the dest_bb is three times as wide, so… 15 units to the left
+@pytest.mark.parametrize(
+    ["source_bb", "source_point", "dest_bb", "expected"],
+    [
+        (
+            NARROW_BB,
+            Point(x=25, y=30),  # five units to the left of the midpoint of the left side
+            BoundingBox(xMin=30, xMax=60, yMin=0, yMax=60),
+            Point(x=15, y=30),  # the dest_bb is three times as wide, so… 15 units to the left
+        ),
+        (
+            NARROW_BB,
+            Point(x=30, y=30),  # exactly at the midpoint of the left side
+            BoundingBox(xMin=-30, xMax=60, yMin=-10, yMax=60),
+            Point(x=-30, y=25),  # should still be exactly at the midpoint of the left side
+        ),
+        (
+            BoundingBox(xMin=30, xMax=50, yMin=0, yMax=60),
+            Point(x=35, y=45),
+            BoundingBox(xMin=10, xMax=70, yMin=20, yMax=40),
+            Point(x=25, y=35),
+        ),
+    ],
+    ids=["basic", "cross_origin", "growing_shrinking"],
+)
+def test_equivalent_point(source_bb: BoundingBox, source_point: Point, dest_bb: BoundingBox, expected: Point):
     assert expected == equivalent_point(source_point, source_bb, dest_bb)
 
 
-def test_equivalent_point_cross_origin():
-    source_bb = BoundingBox(xMin=30, xMax=40, yMin=0, yMax=60)
-    source_point = Point(x=30, y=30)  # exactly at the midpoint of the left side
-    dest_bb = BoundingBox(xMin=-30, xMax=60, yMin=-10, yMax=60)
+def _eq(value: tuple[int | tuple[int, ...], ...]) -> Callable[[], AbstractContextManager]:
+    """Expect find_glyph_codepoints to return value."""
+    return lambda: nullcontext(value)
 
-    # should still be exactly at the midpoint of the left side
-    expected = Point(x=-30, y=25)
-    assert expected == equivalent_point(source_point, source_bb, dest_bb)
 
+def _stack(*cms: AbstractContextManager) -> Callable[[], AbstractContextManager]:
+    """Expect find_glyph_codepoints to satisfy all of cms, such as raises() and warns()."""
 
-def test_equivalent_point_growing_and_shrinking():
-    source_bb = BoundingBox(xMin=30, xMax=50, yMin=0, yMax=60)
-    source_point = Point(x=35, y=45)
-    dest_bb = BoundingBox(xMin=10, xMax=70, yMin=20, yMax=40)
+    def guard() -> AbstractContextManager:
+        stack = ExitStack()
+        for cm in cms:
+            stack.enter_context(cm)
+        return stack
 
-    expected = Point(x=25, y=35)
-    assert expected == equivalent_point(source_point, source_bb, dest_bb)
+    return guard
 
 
-@pytest.fixture
+# find_glyph_codepoints only reads from the font, so a single copy is shared by every test.
+# Under xdist each worker opens its own; unpickling a shared copy would be slower than the lazy open.
+@pytest.fixture(scope="session")
 def codepoint_testboreto():
-    ufo = Font.open(TESTBORETO_PATH)
+    # Lazy loading only parses the glifs these tests actually look at, rather than all 350 in the font.
+    ufo = Font.open(TESTBORETO_PATH, lazy=True)
     # Add some extra values
     ufo.newGlyph("ABC")
     ufo.lib["public.postscriptNames"]["ABC"] = "uni004100420043"
@@ -53,40 +74,34 @@ def codepoint_testboreto():
     return ufo
 
 
-@pytest.mark.parametrize(
-    ["glyphname", "strict", "expected"],
-    [
-        ("zero", True, (0x0030,)),  # one codepoint assigned in glif
-        ("A", True, (0x0041, 0x0061)),  # two codepoints assigned in glif
-        ("zero.tf", True, (0x0030,)),  # no codepoints in glif, but falls back to 'zero'
-        ("ABC", True, ((0x0041, 0x0042, 0x0043),)),
-        # https://github.com/adobe-type-tools/agl-specification?tab=readme-ov-file#3-examples
-        ("Lcommaaccent", False, (0x013B,)),  # single codepoint (see fixture above)
-        ("uni20AC0308", False, ((0x20AC, 0x0308),)),  # ligature glyph with two codepoints
-        ("u1040C.alternate", False, (0x1040C,)),  # variation glyph with a single codepoint
-        ("Lcommaaccent_uni20AC0308_u1040C.alternate", False, ((0x013B, 0x20AC, 0x0308, 0x1040C),)),
-        # Edge cases and errors
-        (".notdef", True, raises(KeyError)),  # deliberately not assigned codepoints
-        ("missingno", True, raises(ValueError)),  # not a known glyph
-        ("missingno", False, [raises(KeyError), warns(GlyphWarning)]),  # not a known glyph
-    ],
+CODEPOINT_CASES = (
+    ("zero", True, _eq((0x0030,))),  # one codepoint assigned in glif
+    ("A", True, _eq((0x0041, 0x0061))),  # two codepoints assigned in glif
+    ("zero.tf", True, _eq((0x0030,))),  # no codepoints in glif, but falls back to 'zero'
+    ("ABC", True, _eq(((0x0041, 0x0042, 0x0043),))),
+    # https://github.com/adobe-type-tools/agl-specification?tab=readme-ov-file#3-examples
+    ("Lcommaaccent", False, _eq((0x013B,))),  # single codepoint (see fixture above)
+    ("uni20AC0308", False, _eq(((0x20AC, 0x0308),))),  # ligature glyph with two codepoints
+    ("u1040C.alternate", False, _eq((0x1040C,))),  # variation glyph with a single codepoint
+    ("Lcommaaccent_uni20AC0308_u1040C.alternate", False, _eq(((0x013B, 0x20AC, 0x0308, 0x1040C),))),
+    # Edge cases and errors
+    (".notdef", True, _stack(raises(KeyError))),  # deliberately not assigned codepoints
+    ("missingno", True, _stack(raises(ValueError))),  # not a known glyph
+    ("missingno", False, _stack(raises(KeyError), warns(GlyphWarning))),  # not a known glyph
 )
+
+
+CODEPOINT_CASE_IDS = tuple(f"{glyphname}-{strict}" for glyphname, strict, _ in CODEPOINT_CASES)
+
+
+@pytest.mark.parametrize(["glyphname", "strict", "expected"], CODEPOINT_CASES, ids=CODEPOINT_CASE_IDS)
 @pytest.mark.filterwarnings("ignore::elerium.warnings.GlyphWarning")
 def test_find_glyph_codepoints(
     codepoint_testboreto: Font,
     glyphname: str,
     strict: bool,
-    expected: tuple[int | tuple[int, ...], ...] | AbstractContextManager | Sequence[AbstractContextManager],
+    expected: Callable[[], AbstractContextManager],
 ):
-    if isinstance(expected, AbstractContextManager):
-        guard = expected
-    elif isinstance(expected, Sequence) and isinstance(expected[0], AbstractContextManager):
-        guard = ExitStack()
-        for cm in expected:
-            guard.enter_context(cm)
-    else:
-        guard = nullcontext(expected)
-
-    with guard as exp:
+    with expected() as exp:
         actual = find_glyph_codepoints(codepoint_testboreto, glyphname, strict=strict)
         assert actual == exp